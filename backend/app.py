@@ -9,38 +9,185 @@ Author: Health Tracker Development Team
 Version: 1.0.0
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, make_response, g, stream_with_context
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
+from flask_compress import Compress
 from flask_cors import CORS
-import sqlite3
-import json
-from datetime import datetime
-import os
-import pytz
+from werkzeug.exceptions import RequestEntityTooLarge
+try:
+    # Optional PGO/LTO-optimized SQLite build (see build_pgo_sqlite.sh)
+    import pysqlite3 as sqlite3
+except ImportError:
+    import sqlite3
+from datetime import date, datetime, timezone, timedelta
+from zoneinfo import ZoneInfo
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+import atexit
+import multiprocessing
+import queue
+import re
+import threading
+import time
+import orjson
+
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider that serializes with orjson instead of the stdlib json module.
+    
+    Installed as app.json, so every jsonify() call in the application is
+    encoded by orjson.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Write orjson's bytes straight into the response, skipping the str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
 
 # Initialize Flask application
 app = Flask(__name__)
-CORS(app)  # Enable CORS for React frontend communication
+app.json = OrjsonProvider(app)  # Faster JSON encoding for all responses
+CORS(app, expose_headers=['X-Next-Cursor'])  # Enable CORS for React frontend communication
+cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache'})  # In-memory GET /treatments response cache
+
+# Brotli/gzip compression for GET /treatments. Compressed bodies are kept in
+# the response cache next to the uncompressed ones, keyed per encoding.
+app.config.update(
+    COMPRESS_REGISTER=False,  # Only routes decorated with @compress.compressed()
+    COMPRESS_ALGORITHM=['br', 'gzip'],
+    COMPRESS_ALGORITHM_STREAMING=['br', 'deflate'],
+    COMPRESS_LEVEL=4,
+    COMPRESS_CACHE_BACKEND=lambda: cache,
+    COMPRESS_CACHE_KEY=lambda request: f'compressed:{g.treatments_cache_key}',
+)
+compress = Compress(app)
+
+# Largest request body accepted by any endpoint (see read_request_body).
+# Werkzeug caps the body stream one byte past it, so an oversized chunked
+# body is detected instead of silently truncated.
+MAX_REQUEST_BODY_BYTES = 4 * 1024 * 1024
+app.config['MAX_CONTENT_LENGTH'] = MAX_REQUEST_BODY_BYTES + 1
 
 # Database configuration
 DATABASE = 'treatments.db'  # SQLite database file for treatment records
 
-def get_israel_time():
+# Pagination configuration for GET /treatments
+DEFAULT_PAGE_SIZE = 100  # Page size used when only a cursor is supplied
+MAX_PAGE_SIZE = 500      # Upper bound for the ?limit= query parameter
+STREAM_BATCH_SIZE = 100  # Rows fetched and written per chunk when streaming the full list
+STREAM_CACHE_MAX_BYTES = 1024 * 1024  # Streamed lists larger than this are not cached
+
+# Bulk inserts larger than this are handed to a process pool (see get_bulk_executor)
+BULK_OFFLOAD_THRESHOLD = 500
+# Each gunicorn worker owns its own pool, so keep it small and fixed
+BULK_POOL_WORKERS = 2
+MAX_BULK_SIZE = 5000  # Upper bound for treatments in one POST /treatments/bulk request
+# Seconds an offloaded batch may take, kept under gunicorn's worker timeout
+BULK_TIMEOUT = 20
+_bulk_executor = None  # Started lazily so importing the app never spawns processes
+_bulk_executor_lock = threading.Lock()
+
+# Validation and timezone constants, built once at import time
+VALID_TREATMENT_TYPES = frozenset({'physiotherapy', 'ultrasound', 'stimulation'})
+DATE_PATTERN = re.compile(r'^[0-9]{4}-[0-9]{2}-[0-9]{2}$')  # YYYY-MM-DD shape check
+ISRAEL_TZ = ZoneInfo('Asia/Jerusalem')
+
+# SQL used on request paths. Kept as module constants so every call passes
+# the identical string and hits the connection's prepared statement cache.
+SQL_INSERT_TREATMENT = '''
+    INSERT INTO treatments (patient_name, treatment_type, treatment_date, notes, created_at)
+    VALUES (?, ?, ?, ?, ?)
+'''
+SQL_SELECT_TREATMENTS = '''
+    SELECT id, patient_name, treatment_type, treatment_date, notes, created_at
+    FROM treatments
+    ORDER BY treatment_date DESC, created_at DESC, id DESC
+'''
+SQL_SELECT_TREATMENTS_PAGE = '''
+    SELECT id, patient_name, treatment_type, treatment_date, notes, created_at
+    FROM treatments
+    ORDER BY treatment_date DESC, created_at DESC, id DESC
+    LIMIT ?
+'''
+# Keyset pagination: seek past the cursor row instead of using OFFSET
+SQL_SELECT_TREATMENTS_AFTER = '''
+    SELECT id, patient_name, treatment_type, treatment_date, notes, created_at
+    FROM treatments
+    WHERE (treatment_date, created_at, id) < (?, ?, ?)
+    ORDER BY treatment_date DESC, created_at DESC, id DESC
+    LIMIT ?
+'''
+SQL_DELETE_TREATMENT = 'DELETE FROM treatments WHERE id = ?'
+SQL_SELECT_VERSION = 'SELECT version FROM treatments_version'
+SQL_LAST_INSERT_ID = 'SELECT last_insert_rowid()'
+
+# Pool of idle persistent connections (see get_db_connection)
+POOL_SIZE = 16  # Idle connections kept open; extras are closed when released
+_pool = queue.LifoQueue(maxsize=POOL_SIZE)
+_write_lock = threading.Lock()  # Serializes writes within this process
+
+# Per-connection tuning applied whenever a connection is opened
+CONNECTION_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',    # Single sync per WAL commit instead of several
+    'PRAGMA temp_store=MEMORY',     # Keep temporary tables and indices in memory
+    'PRAGMA mmap_size=134217728',   # Memory-map up to 128 MiB of the database file
+    'PRAGMA cache_size=-20000',     # ~20 MB page cache
+)
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+def get_timestamp():
+    """
+    Get the current time as a created_at value.
+    
+    Returns:
+        int: Microseconds since the Unix epoch (UTC)
+    """
+    return time.time_ns() // 1000
+
+def format_timestamp(timestamp):
     """
-    Get current time in Israel timezone.
+    Format a stored created_at value for API responses.
+    
+    Args:
+        timestamp (int): Microseconds since the Unix epoch, as stored in the database
     
     Returns:
-        datetime: Current datetime object in Israel/Asia/Jerusalem timezone
+        str: ISO 8601 timestamp in Israel/Asia/Jerusalem timezone
         
     Note:
-        Used for consistent timestamp creation across the application
+        Used for consistent timestamp display across the application
         to ensure all records use the same timezone regardless of server location.
     """
-    israel_tz = pytz.timezone('Asia/Jerusalem')
-    return datetime.now(israel_tz)
+    return (EPOCH + timedelta(microseconds=timestamp)).astimezone(ISRAEL_TZ).isoformat()
+
+def open_db_connection():
+    """
+    Open a new database connection with row factory for named column access.
+    
+    Returns:
+        sqlite3.Connection: Autocommit connection with CONNECTION_PRAGMAS applied
+    """
+    conn = sqlite3.connect(DATABASE, check_same_thread=False, isolation_level=None,
+                           cached_statements=256)
+    conn.row_factory = sqlite3.Row  # Enable column access by name
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
 
 def get_db_connection():
     """
-    Create a database connection with row factory for named column access.
+    Get the database connection for the current application context.
+    
+    A connection is checked out of the pool on first use in a request and
+    returned to it when the request ends, so connections are reused across
+    requests without being tied to a thread or greenlet.
     
     Returns:
         sqlite3.Connection: Database connection object with row factory enabled
@@ -48,10 +195,53 @@ def get_db_connection():
     Note:
         Row factory allows accessing columns by name (row['column_name'])
         instead of just by index, making code more readable and maintainable.
+        The connection runs in autocommit mode; writes should be wrapped in
+        _write_lock.
     """
-    conn = sqlite3.connect(DATABASE)
-    conn.row_factory = sqlite3.Row  # Enable column access by name
-    return conn
+    if 'db' not in g:
+        try:
+            g.db = _pool.get_nowait()
+        except queue.Empty:
+            g.db = open_db_connection()
+    return g.db
+
+@app.teardown_appcontext
+def release_db_connection(exception):
+    """
+    Return the context's connection to the pool, or close it if the pool is full.
+    """
+    conn = g.pop('db', None)
+    if conn is None:
+        return
+    if conn.in_transaction:
+        conn.rollback()  # Never hand out a connection with a half-finished write
+    try:
+        _pool.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+@atexit.register
+def close_db_connections():
+    """
+    Close every pooled database connection.
+    
+    Runs on interpreter shutdown.
+    """
+    while True:
+        try:
+            _pool.get_nowait().close()
+        except queue.Empty:
+            return
+
+def get_treatments_version():
+    """
+    Get the current version of the treatments table.
+    
+    Returns:
+        int: Counter bumped by database triggers on every insert, update
+            or delete, shared by every process using the database
+    """
+    return get_db_connection().execute(SQL_SELECT_VERSION).fetchone()[0]
 
 def init_db():
     """
@@ -63,24 +253,141 @@ def init_db():
     - treatment_type: Type of treatment (Physiotherapy/Ultrasound/Stimulation)
     - treatment_date: Date when treatment was administered (YYYY-MM-DD format)
     - notes: Optional notes about the treatment
-    - created_at: Timestamp when record was created (ISO format with timezone)
+    - created_at: Time the record was created (microseconds since the Unix epoch)
+    
+    Databases created with the older TEXT created_at column are migrated
+    in place (see migrate_created_at).
+    
+    An index on (treatment_date DESC, created_at DESC, id DESC) backs the
+    listing order and keyset pagination used by get_treatments.
+    
+    Also switches the database to WAL journal mode, which is persistent
+    across connections, so readers no longer block on writers.
+    
+    A single-row treatments_version table, kept current by triggers, gives
+    every process a shared change counter for caching GET /treatments.
     
     Raises:
         sqlite3.Error: If database operation fails
     """
-    conn = get_db_connection()
+    conn = open_db_connection()
+    with _write_lock:
+        conn.execute('PRAGMA journal_mode=WAL')
+        # One transaction, so several worker processes can initialize at once
+        conn.execute('BEGIN IMMEDIATE')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS treatments (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                patient_name TEXT NOT NULL,
+                treatment_type TEXT NOT NULL,
+                treatment_date TEXT NOT NULL,
+                notes TEXT,
+                created_at INTEGER NOT NULL
+            )
+        ''')
+        migrate_created_at(conn)
+        # Lets GET /treatments walk rows in display order (and seek straight
+        # to a pagination cursor) without a sort step
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_treatments_order
+            ON treatments (treatment_date DESC, created_at DESC, id DESC)
+        ''')
+        # Seeded from the clock so ETags issued for a previous copy of the
+        # database never match the current one
+        conn.execute('CREATE TABLE IF NOT EXISTS treatments_version (version INTEGER NOT NULL)')
+        conn.execute('''
+            INSERT INTO treatments_version (version)
+            SELECT ? WHERE NOT EXISTS (SELECT 1 FROM treatments_version)
+        ''', (time.time_ns(),))
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            conn.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS treatments_version_{event.lower()}
+                AFTER {event} ON treatments
+                BEGIN
+                    UPDATE treatments_version SET version = version + 1;
+                END
+            ''')
+        conn.commit()
+    conn.close()
+
+def migrate_created_at(conn):
+    """
+    Convert a text created_at column to integer epoch microseconds.
+    
+    Older databases store created_at as ISO 8601 text, or as naive UTC text
+    from CURRENT_TIMESTAMP. SQLite cannot change a column type in place, so
+    the table is rebuilt with the values converted.
+    
+    Args:
+        conn (sqlite3.Connection): Connection with an open write transaction
+    """
+    columns = {column['name']: column['type'] for column in conn.execute('PRAGMA table_info(treatments)')}
+    if columns['created_at'] == 'INTEGER':
+        return
+    
+    rows = []
+    for treatment in conn.execute('SELECT * FROM treatments'):
+        if treatment['created_at'] is None:
+            created_at = get_timestamp()
+        else:
+            created = datetime.fromisoformat(treatment['created_at'])
+            if created.tzinfo is None:
+                created = created.replace(tzinfo=timezone.utc)
+            created_at = (created - EPOCH) // timedelta(microseconds=1)
+        rows.append((treatment['id'], treatment['patient_name'], treatment['treatment_type'],
+                     treatment['treatment_date'], treatment['notes'], created_at))
+    sequence = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'treatments'").fetchone()
+    
     conn.execute('''
-        CREATE TABLE IF NOT EXISTS treatments (
+        CREATE TABLE treatments_migrated (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             patient_name TEXT NOT NULL,
             treatment_type TEXT NOT NULL,
             treatment_date TEXT NOT NULL,
             notes TEXT,
-            created_at TEXT NOT NULL
+            created_at INTEGER NOT NULL
         )
     ''')
-    conn.commit()
-    conn.close()
+    conn.executemany('''
+        INSERT INTO treatments_migrated (id, patient_name, treatment_type, treatment_date, notes, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', rows)
+    conn.execute('DROP TABLE treatments')  # Also drops its index and triggers
+    conn.execute('ALTER TABLE treatments_migrated RENAME TO treatments')
+    if sequence is not None:
+        # Keep ids of deleted records from being reused
+        conn.execute("UPDATE sqlite_sequence SET seq = ? WHERE name = 'treatments'", (sequence[0],))
+    # Invalidate cached listings, whose timestamps were rendered from the old values
+    conn.execute('CREATE TABLE IF NOT EXISTS treatments_version (version INTEGER NOT NULL)')
+    conn.execute('UPDATE treatments_version SET version = version + 1')
+
+def encode_cursor(treatment):
+    """
+    Build an opaque pagination cursor pointing just past a treatment row.
+    
+    Args:
+        treatment (sqlite3.Row): Last row of the current page
+    
+    Returns:
+        str: Cursor in the form "treatment_date|created_at|id"
+    """
+    return f"{treatment['treatment_date']}|{treatment['created_at']}|{treatment['id']}"
+
+def decode_cursor(cursor):
+    """
+    Parse a pagination cursor produced by encode_cursor.
+    
+    Args:
+        cursor (str): Cursor taken from the ?cursor= query parameter
+    
+    Returns:
+        tuple: (treatment_date, created_at, id) of the last row already returned
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    treatment_date, created_at, treatment_id = cursor.split('|')
+    return treatment_date, int(created_at), int(treatment_id)
 
 def validate_treatment_data(data):
     """
@@ -100,30 +407,59 @@ def validate_treatment_data(data):
         - patient_name: Required, must not be empty or whitespace-only
         - treatment_type: Must be one of: 'physiotherapy', 'ultrasound', 'stimulation'
         - treatment_date: Required, must be valid YYYY-MM-DD format
+        - notes: Optional, must be a string when present
     """
     errors = []
     
     # Validate patient name
-    if not data.get('patient_name') or not data['patient_name'].strip():
+    patient_name = data.get('patient_name')
+    if not isinstance(patient_name, str) or not patient_name.strip():
         errors.append('Patient name is required')
     
     # Validate treatment type
-    valid_types = ['physiotherapy', 'ultrasound', 'stimulation']
-    if not data.get('treatment_type') or data['treatment_type'].lower() not in valid_types:
+    treatment_type = data.get('treatment_type')
+    if not isinstance(treatment_type, str) or treatment_type.lower() not in VALID_TREATMENT_TYPES:
         errors.append('Valid treatment type is required (Physiotherapy, Ultrasound, or Stimulation)')
     
     # Validate treatment date
-    if not data.get('treatment_date'):
+    treatment_date = data.get('treatment_date')
+    if not treatment_date:
         errors.append('Treatment date is required')
     else:
         try:
-            # Validate date format (YYYY-MM-DD)
-            datetime.strptime(data['treatment_date'], '%Y-%m-%d')
+            # Reject malformed strings cheaply, then check it is a real calendar
+            # date (date.fromisoformat is far cheaper than strptime)
+            if not isinstance(treatment_date, str) or not DATE_PATTERN.match(treatment_date):
+                raise ValueError
+            date.fromisoformat(treatment_date)
         except ValueError:
             errors.append('Invalid date format. Use YYYY-MM-DD')
     
+    # Validate notes
+    if not isinstance(data.get('notes', ''), str):
+        errors.append('Notes must be text')
+    
     return errors
 
+def read_request_body():
+    """
+    Read the raw request body, enforcing MAX_REQUEST_BODY_BYTES.
+    
+    The body is used once, so Flask's body cache is skipped.
+    
+    Returns:
+        bytes: The request body
+        
+    Raises:
+        RequestEntityTooLarge: If the body is larger than MAX_REQUEST_BODY_BYTES.
+            Werkzeug raises this itself for a too-large Content-Length, but
+            only truncates chunked bodies at MAX_CONTENT_LENGTH.
+    """
+    body = request.get_data(cache=False)
+    if len(body) > MAX_REQUEST_BODY_BYTES:
+        raise RequestEntityTooLarge()
+    return body
+
 @app.route('/treatments', methods=['POST'])
 def create_treatment():
     """
@@ -149,9 +485,17 @@ def create_treatment():
         400: Validation error response
             {
                 "error": "No data provided"
+            } OR {
+                "error": "Invalid JSON"
+            } OR {
+                "error": "Treatment must be a JSON object"
             } OR {
                 "errors": ["validation error message", ...]
             }
+        413: Request body larger than MAX_REQUEST_BODY_BYTES
+            {
+                "error": "Request body too large"
+            }
         500: Server error response
             {
                 "error": "Server error: error message"
@@ -161,50 +505,266 @@ def create_treatment():
         Exception: For database connection or insertion errors
     """
     try:
-        # Parse JSON request body
-        data = request.get_json()
+        # Parse JSON request body straight from the raw bytes, skipping
+        # Flask's parsed-JSON cache
+        try:
+            data = orjson.loads(read_request_body())
+        except orjson.JSONDecodeError:
+            return jsonify({'error': 'Invalid JSON'}), 400
         
         if not data:
             return jsonify({'error': 'No data provided'}), 400
+        if not isinstance(data, dict):
+            return jsonify({'error': 'Treatment must be a JSON object'}), 400
         
         # Validate input data
         validation_errors = validate_treatment_data(data)
         if validation_errors:
             return jsonify({'errors': validation_errors}), 400
         
-        # Insert into database with timezone-aware timestamp
+        # Insert into database with creation timestamp
         conn = get_db_connection()
-        israel_time = get_israel_time().isoformat()
-        cursor = conn.execute('''
-            INSERT INTO treatments (patient_name, treatment_type, treatment_date, notes, created_at)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (
-            data['patient_name'].strip(),
-            data['treatment_type'],
-            data['treatment_date'],
-            data.get('notes', '').strip(),
-            israel_time
-        ))
-        
-        treatment_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        created_at = get_timestamp()
+        with _write_lock:
+            cursor = conn.execute(SQL_INSERT_TREATMENT, (
+                data['patient_name'].strip(),
+                data['treatment_type'],
+                data['treatment_date'],
+                data.get('notes', '').strip(),
+                created_at
+            ))
+            treatment_id = cursor.lastrowid
         
         return jsonify({
             'message': 'Treatment created successfully',
             'id': treatment_id
         }), 201
         
+    except RequestEntityTooLarge:
+        raise  # Rendered by the 413 handler
+    except Exception as e:
+        return jsonify({'error': f'Server error: {str(e)}'}), 500
+
+@app.route('/treatments/bulk', methods=['POST'])
+def create_treatments_bulk():
+    """
+    Create several treatment records in a single transaction.
+    
+    Endpoint: POST /treatments/bulk
+    Content-Type: application/json
+    
+    Request Body:
+        [
+            {
+                "patient_name": "string (required)",
+                "treatment_type": "string (required) - Physiotherapy|Ultrasound|Stimulation",
+                "treatment_date": "string (required) - YYYY-MM-DD format",
+                "notes": "string (optional)"
+            },
+            ...
+        ]
+    
+    Returns:
+        201: Success response with the new treatment IDs, in request order
+            {
+                "message": "N treatments created successfully",
+                "ids": [integer, ...]
+            }
+        400: Validation error response (nothing is inserted)
+            {
+                "error": "No data provided"
+            } OR {
+                "error": "Invalid JSON"
+            } OR {
+                "error": "Expected a JSON array of treatments"
+            } OR {
+                "error": "Too many treatments (max MAX_BULK_SIZE)"
+            } OR {
+                "errors": [{"index": integer, "errors": ["validation error message", ...]}, ...]
+            }
+        413: Request body larger than MAX_REQUEST_BODY_BYTES
+            {
+                "error": "Request body too large"
+            }
+        503: Offloaded batch did not finish within BULK_TIMEOUT (nothing is inserted)
+            {
+                "error": "Bulk insert timed out, try again later"
+            }
+        500: Server error response
+            {
+                "error": "Server error: error message"
+            }
+    
+    Note:
+        All rows are written with one executemany inside one transaction,
+        so the commit cost is paid once for the whole batch. Batches larger
+        than BULK_OFFLOAD_THRESHOLD are processed in a worker process.
+        Batches are capped at MAX_BULK_SIZE treatments.
+    
+    Raises:
+        Exception: For database connection or insertion errors
+    """
+    try:
+        # Parse JSON request body straight from the raw bytes, skipping
+        # Flask's parsed-JSON cache
+        try:
+            data = orjson.loads(read_request_body())
+        except orjson.JSONDecodeError:
+            return jsonify({'error': 'Invalid JSON'}), 400
+        
+        if not data:
+            return jsonify({'error': 'No data provided'}), 400
+        if not isinstance(data, list):
+            return jsonify({'error': 'Expected a JSON array of treatments'}), 400
+        if len(data) > MAX_BULK_SIZE:
+            return jsonify({'error': f'Too many treatments (max {MAX_BULK_SIZE})'}), 400
+        
+        # Large batches are validated and inserted in a worker process so
+        # the CPU-bound work doesn't block other requests on this worker
+        if len(data) > BULK_OFFLOAD_THRESHOLD:
+            deadline = time.time() + BULK_TIMEOUT
+            future = get_bulk_executor().submit(
+                insert_treatments_bulk_in_worker, data, deadline
+            )
+            try:
+                # The worker aborts at the deadline itself; the grace second
+                # lets its rollback be reported instead of racing it
+                validation_errors, ids = future.result(timeout=BULK_TIMEOUT + 1)
+            except (TimeoutError, FutureTimeoutError):
+                future.cancel()
+                return jsonify({'error': 'Bulk insert timed out, try again later'}), 503
+        else:
+            validation_errors, ids = insert_treatments_bulk(get_db_connection(), data)
+        if validation_errors:
+            return jsonify({'errors': validation_errors}), 400
+        
+        return jsonify({
+            'message': f'{len(ids)} treatments created successfully',
+            'ids': ids
+        }), 201
+        
+    except RequestEntityTooLarge:
+        raise  # Rendered by the 413 handler
     except Exception as e:
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
+def insert_treatments_bulk(conn, data):
+    """
+    Validate a list of treatments and insert them in one transaction.
+    
+    Args:
+        conn (sqlite3.Connection): Database connection to write with
+        data (list): Treatment dictionaries from the request body
+    
+    Returns:
+        tuple: (validation errors, new treatment IDs). Nothing is inserted
+            and the ID list is empty if any treatment is invalid.
+    """
+    # Validate every treatment before inserting any of them
+    validation_errors = []
+    for index, treatment in enumerate(data):
+        if not isinstance(treatment, dict):
+            errors = ['Treatment must be a JSON object']
+        else:
+            errors = validate_treatment_data(treatment)
+        if errors:
+            validation_errors.append({'index': index, 'errors': errors})
+    if validation_errors:
+        return validation_errors, []
+    
+    # Insert all rows with a shared creation timestamp
+    created_at = get_timestamp()
+    rows = [(
+        treatment['patient_name'].strip(),
+        treatment['treatment_type'],
+        treatment['treatment_date'],
+        treatment.get('notes', '').strip(),
+        created_at
+    ) for treatment in data]
+    
+    with _write_lock:
+        # Take the write lock up front rather than upgrading mid-transaction
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.executemany(SQL_INSERT_TREATMENT, rows)
+            last_id = conn.execute(SQL_LAST_INSERT_ID).fetchone()[0]
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    
+    # AUTOINCREMENT ids are consecutive within a single write transaction
+    return [], list(range(last_id - len(rows) + 1, last_id + 1))
+
+def insert_treatments_bulk_in_worker(data, deadline):
+    """
+    Run insert_treatments_bulk in a bulk executor process.
+    
+    Worker processes have no application context, so each call uses its
+    own short-lived connection.
+    
+    Args:
+        data (list): Treatment dictionaries from the request body
+        deadline (float): time.time() after which the batch is abandoned
+    
+    Returns:
+        tuple: (validation errors, new treatment IDs)
+        
+    Raises:
+        TimeoutError: If the deadline passes before the batch is committed;
+            the transaction is rolled back, so nothing is inserted
+    """
+    # The batch may have waited in the queue past its deadline
+    if time.time() >= deadline:
+        raise TimeoutError('Bulk insert deadline passed')
+    
+    conn = open_db_connection()
+    # Interrupt the running statement once the deadline passes
+    conn.set_progress_handler(lambda: time.time() >= deadline, 1000)
+    try:
+        return insert_treatments_bulk(conn, data)
+    except sqlite3.OperationalError:
+        if time.time() >= deadline:
+            raise TimeoutError('Bulk insert deadline passed')
+        raise
+    finally:
+        conn.close()
+
+def get_bulk_executor():
+    """
+    Get the process pool used for large bulk inserts, starting it on first use.
+    
+    Returns:
+        concurrent.futures.ProcessPoolExecutor: Pool of BULK_POOL_WORKERS processes
+        
+    Note:
+        Workers are started with the spawn method; forking a process that
+        holds SQLite handles or a gevent hub is unsafe.
+    """
+    global _bulk_executor
+    with _bulk_executor_lock:
+        if _bulk_executor is None:
+            _bulk_executor = ProcessPoolExecutor(
+                max_workers=BULK_POOL_WORKERS,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+    return _bulk_executor
+
 @app.route('/treatments', methods=['GET'])
+@compress.compressed()
 def get_treatments():
     """
-    Retrieve all treatment records.
+    Retrieve treatment records, optionally one page at a time.
     
     Endpoint: GET /treatments
     
+    Query Parameters:
+        limit (int, optional): Maximum number of treatments to return
+            (capped at MAX_PAGE_SIZE). Defaults to DEFAULT_PAGE_SIZE when a
+            cursor is given, otherwise all treatments are returned.
+        cursor (str, optional): Value of the X-Next-Cursor header from the
+            previous page; returns the treatments that follow it.
+    
     Returns:
         200: Success response with list of treatments
             [
@@ -218,6 +778,13 @@ def get_treatments():
                 },
                 ...
             ]
+            When a page is full, the X-Next-Cursor response header holds
+            the cursor for the next page.
+        304: Listing unchanged since the ETag sent in If-None-Match
+        400: Invalid pagination parameters
+            {
+                "error": "Invalid limit" | "Invalid cursor"
+            }
         500: Server error response
             {
                 "error": "Server error: error message"
@@ -226,36 +793,160 @@ def get_treatments():
     Note:
         Results are ordered by treatment_date DESC, created_at DESC
         to show most recent treatments first.
+        Serialized responses are cached per page (limit and cursor) until the next
+        create or delete, and tagged with an ETag for conditional requests.
+        On a cache miss the unpaginated list is streamed in chunks.
+        Responses are Brotli or gzip compressed when the client accepts it.
     
     Raises:
         Exception: For database connection or query errors
     """
     try:
-        conn = get_db_connection()
-        treatments = conn.execute('''
-            SELECT id, patient_name, treatment_type, treatment_date, notes, created_at
-            FROM treatments
-            ORDER BY treatment_date DESC, created_at DESC
-        ''').fetchall()
-        conn.close()
+        # Parse pagination parameters
+        limit = request.args.get('limit')
+        cursor = request.args.get('cursor')
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except ValueError:
+                return jsonify({'error': 'Invalid limit'}), 400
+            if limit < 1:
+                return jsonify({'error': 'Invalid limit'}), 400
+            limit = min(limit, MAX_PAGE_SIZE)
+        elif cursor is not None:
+            limit = DEFAULT_PAGE_SIZE
+        
+        if cursor is not None:
+            try:
+                cursor = decode_cursor(cursor)
+            except ValueError:
+                return jsonify({'error': 'Invalid cursor'}), 400
+        
+        # Serve from cache while no write has happened since it was filled.
+        # Keyed on the parsed page only, so unrelated query parameters can't
+        # fill the cache with copies of the same listing.
+        version = get_treatments_version()
+        cache_key = f'treatments:{version}:{limit}:{cursor}'
+        g.treatments_cache_key = cache_key
         
-        # Convert sqlite3.Row objects to list of dictionaries for JSON serialization
-        treatments_list = []
-        for treatment in treatments:
-            treatments_list.append({
-                'id': treatment['id'],
-                'patient_name': treatment['patient_name'],
-                'treatment_type': treatment['treatment_type'],
-                'treatment_date': treatment['treatment_date'],
-                'notes': treatment['notes'],
-                'created_at': treatment['created_at']
-            })
+        # Answer conditional requests before touching the cache or the listing query.
+        # Compression appends the encoding to the ETag ("123:br"), so match
+        # on the version part.
+        etag = str(version)
+        for tag in request.if_none_match:
+            if tag.split(':')[0] == etag:
+                response = make_response('', 304)
+                response.set_etag(tag)
+                return response
         
-        return jsonify(treatments_list), 200
+        cached = cache.get(cache_key)
+        if cached is None and limit is None:
+            # The unpaginated list is unbounded: stream it instead of building
+            # it in memory. make_conditional() must not be called on this
+            # response, as computing its length would drain the generator.
+            response = Response(stream_with_context(stream_treatments(cache_key)),
+                                mimetype='application/json')
+            response.set_etag(etag)
+            return response
+        if cached is None:
+            cached = build_treatments_page(limit, cursor)
+            cache.set(cache_key, cached)
+        
+        body, next_cursor = cached
+        response = make_response(body)
+        response.mimetype = 'application/json'
+        if next_cursor is not None:
+            response.headers['X-Next-Cursor'] = next_cursor
+        response.set_etag(etag)
+        return response.make_conditional(request)
         
     except Exception as e:
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
+def serialize_treatment(treatment):
+    """
+    Convert a treatment row to the dictionary returned by the API.
+    
+    Args:
+        treatment (sqlite3.Row): Row selected with the API's columns
+    
+    Returns:
+        dict: Treatment with created_at rendered back to ISO format
+        
+    Note:
+        The SELECT already names exactly the columns the API returns,
+        so dict(row) yields the right shape.
+    """
+    treatment_dict = dict(treatment)
+    treatment_dict['created_at'] = format_timestamp(treatment_dict['created_at'])
+    return treatment_dict
+
+def build_treatments_page(limit, cursor):
+    """
+    Query and serialize one page of treatments for GET /treatments.
+    
+    Args:
+        limit (int): Maximum number of rows
+        cursor (tuple or None): Decoded cursor of the last row already returned
+    
+    Returns:
+        tuple: (JSON response body as bytes, next page cursor or None)
+    """
+    conn = get_db_connection()
+    if cursor is not None:
+        treatments = conn.execute(SQL_SELECT_TREATMENTS_AFTER, (*cursor, limit)).fetchall()
+    else:
+        treatments = conn.execute(SQL_SELECT_TREATMENTS_PAGE, (limit,)).fetchall()
+    
+    next_cursor = None
+    if len(treatments) == limit:
+        next_cursor = encode_cursor(treatments[-1])
+    return orjson.dumps([serialize_treatment(treatment) for treatment in treatments]), next_cursor
+
+def stream_treatments(cache_key):
+    """
+    Stream every treatment as a JSON array, STREAM_BATCH_SIZE rows at a time.
+    
+    Rows are read from the cursor in batches and written out as soon as
+    they are encoded, so the full list is never materialized as Python
+    objects and the first bytes reach the client before the query finishes.
+    
+    Args:
+        cache_key (str): Key under which the complete body is cached once
+            the stream finishes
+    
+    Yields:
+        bytes: Consecutive chunks of the JSON response body
+        
+    Note:
+        Chunks are kept for the cache only while the body stays within
+        STREAM_CACHE_MAX_BYTES, so memory held by a large stream is bounded
+        by that cap rather than by the size of the table.
+    """
+    rows = get_db_connection().execute(SQL_SELECT_TREATMENTS)
+    chunks = [b'[']
+    size = 1
+    yield b'['
+    separator = b''
+    while True:
+        treatments = rows.fetchmany(STREAM_BATCH_SIZE)
+        if not treatments:
+            break
+        chunk = separator + b','.join(orjson.dumps(serialize_treatment(treatment)) for treatment in treatments)
+        separator = b','
+        if chunks is not None:
+            size += len(chunk)
+            if size > STREAM_CACHE_MAX_BYTES:
+                chunks = None  # Too large to cache; stop keeping a copy
+            else:
+                chunks.append(chunk)
+        yield chunk
+    yield b']'
+    # Only a completely sent list is cached; an aborted stream never gets here
+    if chunks is not None:
+        chunks.append(b']')
+        cache.set(cache_key, (b''.join(chunks), None))
+
 @app.route('/treatments/<int:treatment_id>', methods=['DELETE'])
 def delete_treatment(treatment_id):
     """
@@ -290,20 +981,13 @@ def delete_treatment(treatment_id):
     try:
         conn = get_db_connection()
         
-        # Check if treatment exists before attempting deletion
-        treatment = conn.execute(
-            'SELECT id FROM treatments WHERE id = ?', (treatment_id,)
-        ).fetchone()
+        # Delete the treatment record; no affected row means it did not exist
+        with _write_lock:
+            deleted = conn.execute(SQL_DELETE_TREATMENT, (treatment_id,)).rowcount
         
-        if not treatment:
-            conn.close()
+        if not deleted:
             return jsonify({'error': 'Treatment not found'}), 404
         
-        # Delete the treatment record
-        conn.execute('DELETE FROM treatments WHERE id = ?', (treatment_id,))
-        conn.commit()
-        conn.close()
-        
         return jsonify({'message': 'Treatment deleted successfully'}), 200
         
     except Exception as e:
@@ -361,6 +1045,22 @@ def method_not_allowed(error):
     """
     return jsonify({'error': 'Method not allowed'}), 405
 
+@app.errorhandler(413)
+def request_entity_too_large(error):
+    """
+    Handle 413 Request Entity Too Large errors.
+    
+    Args:
+        error: The error object (automatically passed by Flask)
+    
+    Returns:
+        JSON response with 413 status code
+            {
+                "error": "Request body too large"
+            }
+    """
+    return jsonify({'error': 'Request body too large'}), 413
+
 if __name__ == '__main__':
     """
     Application entry point.
@@ -373,8 +1073,8 @@ if __name__ == '__main__':
         - Port: 5000 (default Flask port)
     
     Note:
-        In production, this should be replaced with a proper WSGI server
-        like Gunicorn or uWSGI.
+        In production, run under Gunicorn with gevent workers instead:
+        gunicorn -c gunicorn.conf.py app:app (see gunicorn.conf.py).
     """
     # Initialize database on startup
     init_db()
@@ -386,6 +1086,7 @@ if __name__ == '__main__':
     print("Health check: http://localhost:5000/health")
     print("Available endpoints:")
     print("  POST /treatments - Create new treatment")
+    print("  POST /treatments/bulk - Create several treatments at once")
     print("  GET /treatments - Get all treatments")
     print("  DELETE /treatments/{id} - Delete treatment")
     print("  GET /health - Health check")
@@ -0,0 +1,26 @@
+"""
+Gunicorn configuration for running the Treatment Tracker API in production.
+
+Usage (from the backend directory):
+    gunicorn -c gunicorn.conf.py app:app
+
+The API is I/O-bound on SQLite, so gevent workers handle many concurrent
+requests per process; gunicorn's gevent worker monkey-patches the standard
+library before the application is imported.
+"""
+
+import multiprocessing
+
+bind = '0.0.0.0:5000'
+worker_class = 'gevent'
+workers = multiprocessing.cpu_count()
+worker_connections = 1000  # Maximum concurrent clients per worker
+
+def post_worker_init(worker):
+    """
+    Create the database schema once the worker has loaded the application.
+    
+    Runs in every worker; init_db is idempotent and safe to run concurrently.
+    """
+    from app import init_db
+    init_db()
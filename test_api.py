@@ -75,6 +75,106 @@ def test_invalid_treatment():
     print(f"Response: {response.json()}")
     print()
 
+def test_create_treatments_bulk():
+    """Test creating several treatments in one request"""
+    print("Testing POST /treatments/bulk...")
+    treatments_data = [
+        {
+            "patient_name": "Jane Smith",
+            "treatment_type": "Ultrasound",
+            "treatment_date": "2025-09-22",
+            "notes": "First session"
+        },
+        {
+            "patient_name": "Jane Smith",
+            "treatment_type": "Stimulation",
+            "treatment_date": "2025-09-23"
+        }
+    ]
+    
+    response = requests.post(
+        f"{BASE_URL}/treatments/bulk",
+        json=treatments_data,
+        headers={"Content-Type": "application/json"}
+    )
+    print(f"Status: {response.status_code}")
+    print(f"Response: {response.json()}")
+    print()
+    
+    if response.status_code == 201:
+        return response.json().get("ids", [])
+    return []
+
+def test_invalid_treatments_bulk():
+    """Test that bulk creation reports errors per treatment index"""
+    print("Testing invalid bulk treatment creation...")
+    invalid_data = [
+        {
+            "patient_name": "Valid Patient",
+            "treatment_type": "Physiotherapy",
+            "treatment_date": "2025-09-21"
+        },
+        {
+            "patient_name": "",  # Invalid - empty name
+            "treatment_type": "Physiotherapy",
+            "treatment_date": "2025-09-21"
+        },
+        {
+            "patient_name": "Another Patient",
+            "treatment_type": "Ultrasound",
+            "treatment_date": "2025-13-01",  # Invalid - no such month
+            "notes": None  # Invalid - notes must be text
+        }
+    ]
+    
+    response = requests.post(
+        f"{BASE_URL}/treatments/bulk",
+        json=invalid_data,
+        headers={"Content-Type": "application/json"}
+    )
+    print(f"Status: {response.status_code}")
+    print(f"Response: {response.json()}")  # Errors for indexes 1 and 2; nothing inserted
+    print()
+
+def test_get_treatments_paginated():
+    """Test paging through treatments with limit and the X-Next-Cursor header"""
+    print("Testing GET /treatments?limit=1...")
+    response = requests.get(f"{BASE_URL}/treatments", params={"limit": 1})
+    next_cursor = response.headers.get("X-Next-Cursor")
+    print(f"Status: {response.status_code}")
+    print(f"Response: {response.json()}")
+    print(f"X-Next-Cursor: {next_cursor}")
+    print()
+    
+    if not next_cursor:
+        print("No next page")
+        return
+    
+    print("Testing GET /treatments?limit=1&cursor=...")
+    response = requests.get(
+        f"{BASE_URL}/treatments",
+        params={"limit": 1, "cursor": next_cursor}
+    )
+    print(f"Status: {response.status_code}")
+    print(f"Response: {response.json()}")
+    print(f"X-Next-Cursor: {response.headers.get('X-Next-Cursor')}")
+    print()
+
+def test_get_treatments_not_modified():
+    """Test ETag revalidation of the treatments list"""
+    print("Testing GET /treatments with If-None-Match...")
+    response = requests.get(f"{BASE_URL}/treatments")
+    etag = response.headers.get("ETag")
+    print(f"Status: {response.status_code}")
+    print(f"ETag: {etag}")
+    
+    response = requests.get(
+        f"{BASE_URL}/treatments",
+        headers={"If-None-Match": etag}
+    )
+    print(f"Revalidation status: {response.status_code}")  # 304 while the list is unchanged
+    print()
+
 if __name__ == "__main__":
     print("=== Testing Health Treatment Tracker API ===\n")
     
@@ -89,11 +189,21 @@ if __name__ == "__main__":
         # Get treatments again to see the new one
         test_get_treatments()
         
+        # Create several test treatments at once
+        bulk_ids = test_create_treatments_bulk()
+        
+        # Page through treatments and revalidate the cached list
+        test_get_treatments_paginated()
+        test_get_treatments_not_modified()
+        
         # Test validation
         test_invalid_treatment()
+        test_invalid_treatments_bulk()
         
-        # Delete the test treatment
+        # Delete the test treatments
         test_delete_treatment(treatment_id)
+        for bulk_id in bulk_ids:
+            test_delete_treatment(bulk_id)
         
         # Get treatments again to confirm deletion
         test_get_treatments()